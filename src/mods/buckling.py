@@ -1,4 +1,10 @@
+import functools
 import math
+import warnings
+import numpy as np
+
+_K_FACTORS = {'pin': 1, 'fixed': 0.5, 'pin-fixed': 0.7, 'fixed-free': 2}
+SUPPORT_TYPES = tuple(_K_FACTORS)
 
 def max_stress(P, A, e, c, r, L, E):
     """
@@ -34,8 +40,7 @@ def critical_load(E, I, L, support):
     Returns:
         float: Critical load on the column
     """
-    K_dict = {'pin': 1, 'fixed': 0.5, 'pin-fixed': 0.7, 'fixed-free': 2}
-    K = K_dict[support]
+    K = _K_FACTORS[support]
 
     P_cr = (math.pi**2 * E * I)/(K * L)**2
 
@@ -54,9 +59,185 @@ def critical_stress(E_t, L, r, support):
     Returns:
         float: Critical stress on the column
     """
-    K_dict = {'pin': 1, 'fixed': 0.5, 'pin-fixed': 0.7, 'fixed-free': 2}
-    K = K_dict[support]
+    K = _K_FACTORS[support]
 
     sigma_cr = (math.pi**2 * E_t)/((K * L/r)**2)
 
     return sigma_cr
+
+def effective_length_factor(support):
+    """
+    Looks up the effective length factor K for one or more support types.
+
+    Parameters:
+        support (str or array_like of str): Type of support, can be 'pin', 'fixed', 'pin-fixed', or 'fixed-free'
+
+    Returns:
+        numpy.ndarray: Effective length factors with the same shape as `support`
+
+    Raises:
+        ValueError: If an unknown support type is given
+    """
+    support = np.asarray(support)
+    names, inverse = np.unique(support, return_inverse=True)
+    unknown = [str(name) for name in names if name not in _K_FACTORS]
+    if unknown:
+        raise ValueError(f"Unknown support type(s): {unknown}. Expected one of {list(_K_FACTORS)}")
+    K_values = np.array([_K_FACTORS[name] for name in names], dtype=float)
+    return K_values[inverse].reshape(support.shape)
+
+def ramberg_osgood_tangent_modulus(sigma, E, sigma_y, n, offset=0.002):
+    """
+    Calculates the tangent modulus of a Ramberg-Osgood stress-strain curve,
+    epsilon = sigma/E + offset*(sigma/sigma_y)**n.
+
+    Parameters:
+        sigma (float or array_like): Stress at which the tangent modulus is evaluated
+        E (float): Modulus of elasticity of the material
+        sigma_y (float): Yield (offset) strength of the material
+        n (float): Ramberg-Osgood hardening exponent
+        offset (float): Plastic strain at the yield strength, 0.002 by default
+
+    Returns:
+        numpy.ndarray: Tangent modulus d(sigma)/d(epsilon) at `sigma`
+    """
+    sigma = np.abs(np.asarray(sigma, dtype=float))
+    compliance = 1/E + offset*n/sigma_y * (sigma/sigma_y)**(n - 1)
+    return 1/compliance
+
+def _tabulated_curve(strain, stress):
+    """
+    Checks a piecewise linear stress-strain curve and returns it as float arrays (strain, stress).
+    """
+    strain = np.asarray(strain, dtype=float)
+    stress = np.asarray(stress, dtype=float)
+    if strain.ndim != 1 or strain.shape != stress.shape:
+        raise ValueError(f"strain and stress must be 1D and of equal length, got shapes {strain.shape} and "
+                         f"{stress.shape}")
+    if strain.size < 2:
+        raise ValueError("The tabulated curve needs at least 2 points")
+    if strain[0] != 0 or stress[0] != 0:
+        raise ValueError(f"The tabulated curve must start at (0, 0), got ({strain[0]}, {stress[0]})")
+    if np.any(np.diff(strain) <= 0) or np.any(np.diff(stress) <= 0):
+        raise ValueError("Strain and stress of the tabulated curve must be strictly increasing")
+    return strain, stress
+
+def _segment_slope(sigma, strain, stress):
+    """
+    Slope of the segment of a checked tabulated curve containing each `sigma`, 0 beyond the last point.
+    """
+    slopes = np.diff(stress)/np.diff(strain)
+    sigma = np.abs(np.asarray(sigma, dtype=float))
+    segment = np.clip(np.searchsorted(stress, sigma, side='right') - 1, 0, len(slopes) - 1)
+    return np.where(sigma < stress[-1], slopes[segment], 0.0)
+
+def tabulated_tangent_modulus(sigma, strain, stress):
+    """
+    Calculates the tangent modulus of a piecewise linear stress-strain curve.
+
+    Parameters:
+        sigma (float or array_like): Stress at which the tangent modulus is evaluated
+        strain (array_like): Strain points of the curve, starting at 0 and strictly increasing
+        stress (array_like): Stress points of the curve, starting at 0 and strictly increasing
+
+    Returns:
+        numpy.ndarray: Slope of the curve segment containing `sigma`, or 0 beyond the last stress point
+
+    Raises:
+        ValueError: If `strain` and `stress` differ in length, have fewer than 2 points, do not start at
+            (0, 0) or are not strictly increasing
+    """
+    return _segment_slope(sigma, *_tabulated_curve(strain, stress))
+
+def critical_stress_tangent_modulus(L, r, support, E=None, sigma_y=None, n=None, strain=None, stress=None,
+                                    offset=0.002, tol=1e-10, max_iter=200):
+    """
+    Calculates the inelastic critical stress of many columns at once by solving Engesser's equation,
+    sigma_cr = pi**2 * E_t(sigma_cr) / (K*L/r)**2, with the tangent modulus taken from a stress-strain curve.
+
+    The curve is either Ramberg-Osgood (give `E`, `sigma_y` and `n`) or tabulated (give `strain` and `stress`).
+    All columns are solved together with a bracketed Illinois iteration that falls back to bisection
+    when a step does not halve the bracket. Converged columns are dropped from the active set so later
+    iterations only touch the columns that still need work.
+
+    Parameters:
+        L (float or array_like): Length of the columns
+        r (float or array_like): Radius of gyration of the cross-sections
+        support (str or array_like of str): Type of support, can be 'pin', 'fixed', 'pin-fixed', or 'fixed-free'
+        E (float): Modulus of elasticity of the material (defaults to the initial slope of a tabulated curve)
+        sigma_y (float): Yield (offset) strength for a Ramberg-Osgood curve
+        n (float): Hardening exponent for a Ramberg-Osgood curve
+        strain (array_like): Strain points of a tabulated curve
+        stress (array_like): Stress points of a tabulated curve
+        offset (float): Plastic strain at `sigma_y` for a Ramberg-Osgood curve
+        tol (float): Relative tolerance on the residual of Engesser's equation
+        max_iter (int): Maximum number of iterations
+
+    Returns:
+        numpy.ndarray: Critical stress of each column, broadcast over `L`, `r` and `support`.
+        Columns that do not converge within `max_iter` iterations are NaN and a RuntimeWarning is issued.
+
+    Raises:
+        ValueError: If neither or both of a complete Ramberg-Osgood and a tabulated curve are given,
+            if a tabulated curve is malformed (see `tabulated_tangent_modulus`) or its initial slope does not
+            match `E`, or if any `L` or `r` is not positive
+    """
+    tabulated = strain is not None and stress is not None
+    if tabulated and (sigma_y is not None or n is not None):
+        raise ValueError("Please provide either a Ramberg-Osgood curve (sigma_y, n) or a tabulated curve "
+                         "(strain, stress), not both")
+    if tabulated:
+        strain_arr, stress_arr = _tabulated_curve(strain, stress)
+        initial_slope = stress_arr[1]/strain_arr[1]
+        if E is None:
+            E = initial_slope
+        elif not math.isclose(E, initial_slope, rel_tol=1e-6):
+            raise ValueError(f"E = {E} does not match the initial slope {initial_slope} of the tabulated curve")
+        sigma_max = stress_arr[-1]
+        tangent_modulus = functools.partial(_segment_slope, strain=strain_arr, stress=stress_arr)
+    elif E is not None and sigma_y is not None and n is not None:
+        sigma_max = np.inf
+        tangent_modulus = functools.partial(ramberg_osgood_tangent_modulus, E=E, sigma_y=sigma_y, n=n, offset=offset)
+    else:
+        raise ValueError("Please provide either E, sigma_y and n (Ramberg-Osgood) or strain and stress (tabulated)")
+
+    L, r, K = np.broadcast_arrays(np.asarray(L, dtype=float), np.asarray(r, dtype=float),
+                                  effective_length_factor(support))
+    if np.any(L <= 0) or np.any(r <= 0):
+        raise ValueError("Column lengths L and radii of gyration r must be positive")
+    coef = (math.pi**2/(K*L/r)**2).ravel()
+
+    # f(sigma) = sigma - coef*E_t(sigma) is increasing, negative at 0 and non-negative at the Euler stress
+    a = np.zeros_like(coef)
+    fa = -coef*E
+    b = np.minimum(coef*E, sigma_max)
+    fb = b - coef*tangent_modulus(b)
+    sigma_cr = b.copy()
+    active = np.flatnonzero(fb > 0)
+    a, fa, b, fb = a[active], fa[active], b[active], fb[active]
+
+    bisect = np.zeros(active.size, dtype=bool)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        # fall back to bisection where the previous step failed to halve the bracket
+        c = np.where(bisect, (a + b)/2, (a*fb - b*fa)/(fb - fa))
+        fc = c - coef[active]*tangent_modulus(c)
+        width = np.abs(b - a)
+        flip = fc*fb < 0
+        a = np.where(flip, b, a)
+        fa = np.where(flip, fb, np.where(bisect, fa, fa/2))
+        b, fb = c, fc
+        bisect = np.abs(b - a) > width/2
+        sigma_cr[active] = b
+        # the bracket test catches roots at breakpoints of a tabulated curve, where the residual jumps
+        done = (np.abs(fb) <= tol*np.abs(b)) | (np.abs(b - a) <= 4*np.finfo(float).eps*np.abs(b))
+        keep = ~done
+        active, a, fa, b, fb, bisect = active[keep], a[keep], fa[keep], b[keep], fb[keep], bisect[keep]
+
+    if active.size > 0:
+        sigma_cr[active] = np.nan
+        warnings.warn(f"{active.size} column(s) did not converge in {max_iter} iterations; "
+                      "their critical stress is set to NaN", RuntimeWarning)
+
+    return sigma_cr.reshape(K.shape)
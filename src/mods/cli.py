@@ -0,0 +1,346 @@
+import argparse
+import glob
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from mods import datasets
+from mods import strain_transformation
+from mods import stress_transformation
+
+DEFAULT_COLUMNS = {
+    'stress': ('sigma_x', 'sigma_y', 'tau_xy'),
+    'strain': ('epsilon_x', 'epsilon_y', 'gamma_xy'),
+}
+
+QUANTITIES = ('principal', 'max_shear', 'mohr', 'utilization')
+
+def compute(x, y, xy, kind='stress', quantities=QUANTITIES, yield_strength=None):
+    """
+    Computes the selected quantities for arrays of plane stress or plane strain states.
+
+    Parameters:
+        x (numpy.ndarray): Normal stress (strain) in the x direction
+        y (numpy.ndarray): Normal stress (strain) in the y direction
+        xy (numpy.ndarray): Shear stress (engineering shear strain) in the x-y plane
+        kind (str): 'stress' or 'strain'
+        quantities (iterable of str): Any of 'principal', 'max_shear', 'mohr' and 'utilization'
+        yield_strength (float): Yield strength used for 'utilization' (stress only)
+
+    Returns:
+        dict: Result columns keyed by name, in a stable order
+
+    Raises:
+        ValueError: If 'utilization' is requested for strain or without a yield strength
+    """
+    out = {}
+    if kind == 'stress':
+        if 'principal' in quantities or 'utilization' in quantities:
+            sigma_1, sigma_2 = stress_transformation.principal_stress(x, y, xy)
+        if 'principal' in quantities:
+            out['sigma_1'], out['sigma_2'] = sigma_1, sigma_2
+            out['theta_p'] = stress_transformation.principal_stress_angle(x, y, xy)[0]
+        if 'max_shear' in quantities:
+            out['tau_max'] = stress_transformation.maximum_in_plane_shear_stress(x, y, xy)
+        if 'mohr' in quantities:
+            out['center'], out['radius'] = stress_transformation.mohrs_circle(x, y, xy)
+        if 'utilization' in quantities:
+            if yield_strength is None:
+                raise ValueError("Please provide a material to compute utilization")
+            out['von_mises_utilization'] = np.sqrt(sigma_1**2 - sigma_1*sigma_2 + sigma_2**2)/yield_strength
+            tresca = np.maximum(np.maximum(np.abs(sigma_1), np.abs(sigma_2)), np.abs(sigma_1 - sigma_2))
+            out['tresca_utilization'] = tresca/yield_strength
+    else:
+        if 'utilization' in quantities:
+            raise ValueError("Utilization is only available for stress inputs")
+        if 'principal' in quantities:
+            out['epsilon_1'], out['epsilon_2'] = strain_transformation.principal_strain(x, y, xy)
+            out['theta_p'] = strain_transformation.principal_strain_angle(x, y, xy)[0]
+        if 'max_shear' in quantities:
+            out['gamma_max'] = strain_transformation.maximum_in_plane_shear_strain(x, y, xy)
+        if 'mohr' in quantities:
+            center, radius = strain_transformation.mohrs_circle(x, y, xy)
+            out['center'], out['radius'] = center[0], radius
+    return out
+
+def yield_strength(material, units='si'):
+    """
+    Looks up the tensile yield strength of a material in the mechanical property tables.
+
+    Parameters:
+        material (str): Material name, e.g. 'Structural A-36'
+        units (str): 'si' (MPa) or 'imperial' (ksi)
+
+    Returns:
+        float: Tensile yield strength
+
+    Raises:
+        ValueError: If the material is unknown or has no tabulated yield strength
+    """
+    if units == 'si':
+        df, column = datasets.get_mechanical_properties_si(), 'Tens. Yield Strength (MPa)'
+    else:
+        df, column = datasets.get_mechanical_properties_imperial(), 'Tens. Yield Strength (ksi)'
+    rows = df[df['Material'] == material]
+    if rows.empty:
+        raise ValueError(f"Unknown material '{material}'. Expected one of {df['Material'].tolist()}")
+    value = rows[column].iloc[0]
+    if pd.isna(value):
+        raise ValueError(f"No tensile yield strength is tabulated for '{material}'")
+    return float(value)
+
+# CSV files are only split across workers when every part gets at least this many bytes
+_MIN_CSV_PART_BYTES = 64*1024
+
+def _output_paths(paths, output_dir):
+    """
+    Maps each input to `<name>_mods.<ext>`, next to the input or, with `output_dir`, under it
+    with the input directories kept relative to their common parent.
+    """
+    if not output_dir:
+        return [os.path.join(os.path.dirname(path), "{}_mods{}".format(*os.path.splitext(os.path.basename(path))))
+                for path in paths]
+    dirs = [os.path.dirname(os.path.abspath(path)) for path in paths]
+    base = os.path.commonpath(dirs)
+    return [os.path.join(output_dir, os.path.relpath(d, base),
+                         "{}_mods{}".format(*os.path.splitext(os.path.basename(path))))
+            for path, d in zip(paths, dirs)]
+
+class _ByteRange:
+    """
+    Read-only file object limited to `length` bytes of `f` from its current position.
+    """
+
+    def __init__(self, f, length):
+        self._f = f
+        self._remaining = length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._f.read(size)
+        self._remaining -= len(data)
+        return data
+
+def _process_csv_range(path, out_path, start, stop, names, columns, kind, quantities, sy, chunk_size,
+                       float_format, header):
+    """
+    Streams bytes [start, stop) of a CSV file, which must hold whole lines, through `compute`
+    chunk by chunk and returns the number of rows processed.
+    """
+    rows = 0
+    with open(path, 'rb') as f:
+        f.seek(start)
+        chunks = pd.read_csv(_ByteRange(f, stop - start), names=names, header=None, chunksize=chunk_size) \
+            if stop > start else []
+        for chunk in chunks:
+            x, y, xy = (chunk[c].to_numpy(dtype=float) for c in columns)
+            result = pd.DataFrame(compute(x, y, xy, kind, quantities, sy))
+            result.to_csv(out_path, mode='w' if rows == 0 else 'a', header=header and rows == 0, index=False,
+                          float_format=float_format)
+            rows += len(result)
+    if rows == 0:
+        empty = np.zeros(0)
+        pd.DataFrame(compute(empty, empty, empty, kind, quantities, sy)).to_csv(out_path, header=header, index=False)
+    return rows
+
+def _csv_tasks(path, out_path, columns, kind, quantities, sy, chunk_size, float_format, workers):
+    """
+    Splits the data lines of a CSV file into up to one byte range per worker.
+
+    Returns:
+        tuple: (tasks, part paths); the parts are concatenated into `out_path` in order
+    """
+    names = list(pd.read_csv(path, nrows=0).columns)
+    missing = [c for c in columns if c not in names]
+    if missing:
+        raise ValueError(f"{path}: missing column(s) {missing}; use --columns to name the x, y and xy columns")
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        f.readline()
+        bounds = [f.tell()]
+        n_parts = max(1, min(workers, (size - bounds[0])//_MIN_CSV_PART_BYTES))
+        for i in range(1, n_parts):
+            # move each cut to the start of the next line
+            f.seek(bounds[0] + i*(size - bounds[0])//n_parts - 1)
+            f.readline()
+            if f.tell() > bounds[-1]:
+                bounds.append(f.tell())
+        bounds.append(size)
+    bounds = sorted(set(bounds)) if size > bounds[0] else bounds
+    n_parts = len(bounds) - 1
+    parts = [out_path] if n_parts == 1 else [f"{out_path}.part{i}" for i in range(n_parts)]
+    tasks = [(_process_csv_range, (path, part, lo, hi, names, columns, kind, quantities, sy, chunk_size,
+                                   float_format, i == 0))
+             for i, (part, lo, hi) in enumerate(zip(parts, bounds[:-1], bounds[1:]))]
+    return tasks, parts
+
+def _process_npy_range(path, out_path, start, stop, kind, quantities, sy, chunk_size):
+    """
+    Processes rows [start, stop) of an (N, 3) NPY file into an existing structured NPY output.
+    """
+    data = np.load(path, mmap_mode='r')
+    out = np.load(out_path, mmap_mode='r+')
+    for lo in range(start, stop, chunk_size):
+        hi = min(lo + chunk_size, stop)
+        block = np.asarray(data[lo:hi], dtype=float)
+        for name, values in compute(block[:, 0], block[:, 1], block[:, 2], kind, quantities, sy).items():
+            out[name][lo:hi] = values
+    out.flush()
+    return stop - start
+
+def _npy_tasks(path, out_path, kind, quantities, sy, chunk_size, workers):
+    """
+    Creates the structured NPY output for `path` and splits its rows into one task per worker.
+    """
+    data = np.load(path, mmap_mode='r')
+    if data.ndim != 2 or data.shape[1] != 3:
+        raise ValueError(f"{path}: expected an array of shape (N, 3), got {data.shape}")
+    names = list(compute(np.zeros(1), np.zeros(1), np.zeros(1), kind, quantities, sy))
+    np.lib.format.open_memmap(out_path, mode='w+', dtype=[(name, float) for name in names],
+                              shape=(data.shape[0],)).flush()
+    n = data.shape[0]
+    bounds = np.linspace(0, n, max(1, min(workers, -(-n//chunk_size))) + 1).astype(int)
+    return [(_process_npy_range, (path, out_path, lo, hi, kind, quantities, sy, chunk_size))
+            for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+def build_parser():
+    """
+    Builds the argument parser of the `mods` command.
+
+    Returns:
+        argparse.ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog='mods',
+        description="Batch-compute principal values, maximum shear, Mohr's circle parameters "
+                    "and failure utilizations for tables of plane stress or strain states.")
+    parser.add_argument('inputs', nargs='+',
+                        help="CSV files with a header row and one state per line, or NPY files of shape (N, 3); "
+                             "glob patterns such as 'runs/*.csv' are expanded, skipping previous *_mods outputs")
+    parser.add_argument('--kind', choices=sorted(DEFAULT_COLUMNS), default='stress',
+                        help="input type (default: stress)")
+    parser.add_argument('-q', '--quantities', default='principal,max_shear,mohr',
+                        help=f"comma-separated subset of {','.join(QUANTITIES)} (default: principal,max_shear,mohr)")
+    parser.add_argument('-m', '--material', help="material name from mods.datasets, required for utilization")
+    parser.add_argument('--units', choices=['si', 'imperial'], default='si', help="unit system of the material table")
+    parser.add_argument('--columns', help="comma-separated x, y and xy column names of CSV inputs")
+    parser.add_argument('--float-format',
+                        help="printf-style format of CSV outputs, e.g. '%%.8g' (default: full precision)")
+    parser.add_argument('-o', '--output-dir',
+                        help="directory for <name>_mods.<ext> outputs, keeping the input directories relative "
+                             "to their common parent (default: next to inputs)")
+    parser.add_argument('--chunk-size', type=int, default=100_000, help="rows per chunk (default: 100000)")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1,
+                        help="worker processes; files are processed in parallel and large files are split "
+                             "into row ranges (NPY) or line-aligned byte ranges (CSV) (default: number of CPUs)")
+    return parser
+
+def main(argv=None):
+    """
+    Entry point of the `mods` command.
+
+    Parameters:
+        argv (list of str): Command-line arguments, `sys.argv[1:]` by default
+
+    Returns:
+        int: Exit status
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    quantities = tuple(q.strip() for q in args.quantities.split(',') if q.strip())
+    unknown = [q for q in quantities if q not in QUANTITIES]
+    if unknown:
+        parser.error(f"unknown quantities {unknown}; choose from {list(QUANTITIES)}")
+    columns = tuple(args.columns.split(',')) if args.columns else DEFAULT_COLUMNS[args.kind]
+    if len(columns) != 3:
+        parser.error("--columns needs exactly three names")
+    if args.chunk_size < 1 or args.workers < 1:
+        parser.error("--chunk-size and --workers must be positive")
+
+    paths = []
+    for pattern in args.inputs:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern))
+            # rerunning a pattern over its own directory would otherwise pick up the previous outputs
+            previous = [m for m in matches if os.path.splitext(m)[0].endswith('_mods')]
+            if previous:
+                print(f"mods: skipping {len(previous)} previous output(s) matching '{pattern}'", file=sys.stderr)
+                matches = [m for m in matches if m not in previous]
+        else:
+            matches = [pattern]
+        if not matches:
+            parser.error(f"no files match '{pattern}'")
+        paths.extend(matches)
+    for path in paths:
+        if not os.path.isfile(path):
+            parser.error(f"no such file: '{path}'")
+        if os.path.splitext(path)[1].lower() not in ('.csv', '.npy'):
+            parser.error(f"unsupported input '{path}'; expected .csv or .npy")
+    # the same file matched by several patterns is processed once
+    unique = {}
+    for path in paths:
+        unique.setdefault(os.path.realpath(path), path)
+    paths = list(unique.values())
+
+    out_paths = _output_paths(paths, args.output_dir)
+    targets = {}
+    for path, out_path in zip(paths, out_paths):
+        target = os.path.realpath(out_path)
+        if target in unique:
+            parser.error(f"output '{out_path}' for '{path}' would overwrite an input")
+        if target in targets:
+            parser.error(f"'{targets[target]}' and '{path}' would both be written to '{out_path}'")
+        targets[target] = path
+    for out_path in out_paths:
+        os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+
+    parts = []
+    try:
+        sy = yield_strength(args.material, args.units) if args.material else None
+        compute(np.zeros(1), np.zeros(1), np.zeros(1), args.kind, quantities, sy)
+
+        tasks = []
+        merges = []
+        for path, out_path in zip(paths, out_paths):
+            if path.lower().endswith('.npy'):
+                tasks.extend(_npy_tasks(path, out_path, args.kind, quantities, sy, args.chunk_size, args.workers))
+            else:
+                csv_tasks, csv_parts = _csv_tasks(path, out_path, columns, args.kind, quantities, sy,
+                                                  args.chunk_size, args.float_format, args.workers)
+                tasks.extend(csv_tasks)
+                if len(csv_parts) > 1:
+                    parts.extend(csv_parts)
+                    merges.append((out_path, csv_parts))
+
+        start = time.perf_counter()
+        if args.workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=min(args.workers, len(tasks))) as pool:
+                rows = sum(f.result() for f in [pool.submit(func, *task_args) for func, task_args in tasks])
+        else:
+            rows = sum(func(*task_args) for func, task_args in tasks)
+        for out_path, csv_parts in merges:
+            with open(out_path, 'wb') as out:
+                for part in csv_parts:
+                    with open(part, 'rb') as f:
+                        shutil.copyfileobj(f, out)
+        elapsed = time.perf_counter() - start
+    except ValueError as e:
+        print(f"mods: error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        for part in parts:
+            if os.path.exists(part):
+                os.remove(part)
+
+    print(f"Processed {rows} rows from {len(paths)} file(s) in {elapsed:.3f} s "
+          f"({rows/elapsed if elapsed > 0 else float('inf'):,.0f} rows/s, {min(args.workers, len(tasks))} worker(s))",
+          file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
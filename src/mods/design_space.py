@@ -0,0 +1,189 @@
+import math
+import numpy as np
+import pandas as pd
+from mods import datasets
+from mods.buckling import SUPPORT_TYPES, effective_length_factor
+
+_DIMS = ('section', 'support', 'length', 'material')
+
+def _find_column(df, prefix):
+    """
+    Returns the name of the first column of `df` that starts with `prefix`.
+    """
+    for column in df.columns:
+        if column.startswith(prefix):
+            return column
+    raise KeyError(f"No column starting with '{prefix}'")
+
+def _as_list(labels):
+    """
+    Returns `labels` as a list, wrapping a single label.
+    """
+    return [labels] if isinstance(labels, str) else list(labels)
+
+def _select(df, column, labels):
+    """
+    Returns the rows of `df` whose `column` is in `labels`, in the order of `labels`.
+    """
+    if labels is None:
+        return df
+    labels = _as_list(labels)
+    indexed = df.set_index(column, drop=False)
+    missing = [label for label in labels if label not in indexed.index]
+    if missing:
+        raise ValueError(f"Unknown {column} value(s): {missing}")
+    return indexed.loc[labels].reset_index(drop=True)
+
+class CapacityGrid:
+    """
+    Euler critical loads over sections x supports x lengths x materials, evaluated lazily.
+
+    Nothing is computed until `values`, `sel`, `tiles` or `to_frame` is used, and only the
+    requested part of the grid is evaluated. Units follow the inputs: N with mm and MPa, kip with in and ksi.
+
+    Attributes:
+        dims (tuple): Axis names, ('section', 'support', 'length', 'material')
+        coords (dict): Axis labels keyed by axis name
+        shape (tuple): Shape of the full capacity array
+    """
+
+    def __init__(self, I, K, L, E, coords):
+        self._factors = (np.asarray(I, dtype=float), np.asarray(K, dtype=float),
+                         np.asarray(L, dtype=float), np.asarray(E, dtype=float))
+        self.dims = _DIMS
+        self.coords = coords
+        self.shape = tuple(len(f) for f in self._factors)
+        self._values = None
+
+    def _evaluate(self, index):
+        """
+        Evaluates P_cr = pi^2 E I / (K L)^2 on the outer product of the indexed factors.
+        """
+        I, K, L, E = (f[i] for f, i in zip(self._factors, index))
+        KL = K[:, None]*L[None, :]
+        return (math.pi**2 * I[:, None, None, None] * E[None, None, None, :]) / (KL**2)[None, :, :, None]
+
+    def tiles(self, tile_size=64):
+        """
+        Yields the grid in tiles along the section axis.
+
+        Parameters:
+            tile_size (int): Number of sections per tile
+
+        Returns:
+            generator: (section slice, numpy.ndarray) pairs
+        """
+        full = slice(None)
+        for start in range(0, self.shape[0], tile_size):
+            rows = slice(start, min(start + tile_size, self.shape[0]))
+            yield rows, self._evaluate((rows, full, full, full))
+
+    @property
+    def values(self):
+        """
+        numpy.ndarray: Full capacity array, computed tile by tile on first access and cached.
+        """
+        if self._values is None:
+            values = np.empty(self.shape)
+            for rows, tile in self.tiles():
+                values[rows] = tile
+            self._values = values
+        return self._values
+
+    def sel(self, **labels):
+        """
+        Evaluates the part of the grid matching the given axis labels.
+
+        Parameters:
+            **labels: Axis name mapped to a single label or a list of labels, e.g. support='pin'
+
+        Returns:
+            numpy.ndarray: Capacities, with the axes given a single label dropped
+
+        Raises:
+            ValueError: If an axis name or label is unknown
+        """
+        index = []
+        squeeze = []
+        for axis, dim in enumerate(self.dims):
+            if dim not in labels:
+                index.append(slice(None))
+                continue
+            wanted = labels.pop(dim)
+            scalar = np.ndim(wanted) == 0
+            positions = []
+            for label in np.atleast_1d(wanted):
+                matches = np.flatnonzero(np.asarray(self.coords[dim]) == label)
+                if matches.size == 0:
+                    raise ValueError(f"Unknown {dim} label: {label}")
+                positions.append(matches[0])
+            index.append(np.array(positions))
+            if scalar:
+                squeeze.append(axis)
+        if labels:
+            raise ValueError(f"Unknown axis name(s): {list(labels)}. Expected some of {list(self.dims)}")
+        if self._values is not None:
+            result = self._values[np.ix_(*[np.arange(n)[i] for n, i in zip(self.shape, index)])]
+        else:
+            result = self._evaluate(index)
+        return result.squeeze(axis=tuple(squeeze)) if squeeze else result
+
+    def to_frame(self, name='critical_load'):
+        """
+        Converts the grid to a long-format DataFrame for export.
+
+        Parameters:
+            name (str): Name of the capacity column
+
+        Returns:
+            pandas.DataFrame: One row per grid point, with one column per axis plus the capacity column
+        """
+        index = pd.MultiIndex.from_product([self.coords[dim] for dim in self.dims], names=list(self.dims))
+        return pd.DataFrame({name: self.values.ravel()}, index=index).reset_index()
+
+def critical_load_grid(lengths, sections=None, supports=None, materials=None, units='si', axis='yy'):
+    """
+    Builds the Euler critical load grid over W-shapes, support types, lengths and materials.
+
+    Parameters:
+        lengths (array_like): Column lengths (mm for 'si', in for 'imperial')
+        sections (str or list of str): W-shape designations, all shapes in the W-shape table by default
+        supports (str or list of str): Support types, all of 'pin', 'fixed', 'pin-fixed' and 'fixed-free' by default
+        materials (str or list of str): Material names, every material in the mechanical property table by default
+        units (str): 'si' (mm, MPa, N) or 'imperial' (in, ksi, kip)
+        axis (str): Bending axis of the moment of inertia, 'yy' (weak axis) or 'xx'
+
+    Returns:
+        CapacityGrid: Lazily evaluated critical loads
+
+    Raises:
+        ValueError: If `units` or `axis` is unknown, or a section, support or material is not found
+    """
+    if units == 'si':
+        shapes, props = datasets.get_w_shapes_si(), datasets.get_mechanical_properties_si()
+        E_prefix = 'Moduls of Elasticity (MPa)'
+    elif units == 'imperial':
+        shapes, props = datasets.get_w_shapes_imperial(), datasets.get_mechanical_properties_imperial()
+        E_prefix = 'Moduls of Elasticity (ksi)'
+    else:
+        raise ValueError("units must be 'si' or 'imperial'")
+    if axis not in ('xx', 'yy'):
+        raise ValueError("axis must be 'xx' or 'yy'")
+
+    designation = _find_column(shapes, 'designation')
+    shapes = _select(shapes, designation, sections)
+    props = _select(props, 'Material', materials)
+    supports = list(SUPPORT_TYPES) if supports is None else _as_list(supports)
+    lengths = np.atleast_1d(np.asarray(lengths, dtype=float))
+
+    coords = {
+        'section': shapes[designation].tolist(),
+        'support': supports,
+        'length': lengths,
+        'material': props['Material'].tolist(),
+    }
+    return CapacityGrid(shapes[_find_column(shapes, 'I' + axis)].to_numpy(),
+                        effective_length_factor(supports),
+                        lengths,
+                        props[_find_column(props, E_prefix)].to_numpy(),
+                        coords)
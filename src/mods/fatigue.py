@@ -0,0 +1,236 @@
+import math
+import numpy as np
+
+def findley_parameter(sigma_n, tau, k=0.3):
+    """
+    Calculates the Findley damage parameter on a plane.
+
+    Parameters:
+        sigma_n (float or array_like): Normal stress on the plane
+        tau (float or array_like): Shear stress magnitude on the plane
+        k (float): Findley normal stress sensitivity constant
+
+    Returns:
+        numpy.ndarray: tau + k*sigma_n
+    """
+    return np.asarray(tau) + k*np.asarray(sigma_n)
+
+def _stress_tensor(sigma_x, sigma_y, tau_xy, sigma_z, tau_yz, tau_zx):
+    """
+    Stacks stress components into an array of symmetric 3x3 tensors of shape (N, 3, 3).
+    """
+    components = np.broadcast_arrays(*[np.asarray(c, dtype=float) for c in
+                                       (sigma_x, sigma_y, sigma_z, tau_xy, tau_yz, tau_zx)])
+    shape = components[0].shape
+    sx, sy, sz, txy, tyz, tzx = (c.ravel() for c in components)
+    S = np.empty((sx.size, 3, 3))
+    S[:, 0, 0], S[:, 1, 1], S[:, 2, 2] = sx, sy, sz
+    S[:, 0, 1] = S[:, 1, 0] = txy
+    S[:, 1, 2] = S[:, 2, 1] = tyz
+    S[:, 2, 0] = S[:, 0, 2] = tzx
+    return S, shape
+
+def _plane_damage(S, n, damage):
+    """
+    Evaluates damage(sigma_n, tau) for each stress state S[i] on the planes with unit normals n[i, j].
+    """
+    traction = np.einsum('iab,ijb->ija', S, n)
+    sigma_n = np.einsum('ija,ija->ij', traction, n)
+    tau = np.sqrt(np.maximum(np.einsum('ija,ija->ij', traction, traction) - sigma_n**2, 0))
+    return damage(sigma_n, tau)
+
+def _tangent_basis(n, planar):
+    """
+    Returns unit vectors tangent to the sphere at each normal n[i] (only the in-plane one when `planar`).
+    """
+    if planar:
+        return [np.stack([-n[:, 1], n[:, 0], np.zeros(len(n))], axis=-1)]
+    helper = np.zeros_like(n)
+    near_z = np.abs(n[:, 2]) > 0.9
+    helper[near_z, 0] = 1
+    helper[~near_z, 2] = 1
+    t1 = np.cross(n, helper)
+    t1 /= np.linalg.norm(t1, axis=1, keepdims=True)
+    return [t1, np.cross(n, t1)]
+
+def _newton_step(values, best, h):
+    """
+    Returns the Newton step in tangent-plane coordinates from central differences on the compass
+    stencil, or NaN where the local quadratic model is not concave.
+    """
+    if values.shape[1] == 2:
+        g = (values[:, 0] - values[:, 1])/(2*h)
+        H = (values[:, 0] + values[:, 1] - 2*best)/h**2
+        return np.where(H < 0, -g/np.where(H < 0, H, 1), np.nan)[:, None]
+    gx = (values[:, 0] - values[:, 1])/(2*h)
+    gy = (values[:, 2] - values[:, 3])/(2*h)
+    Hxx = (values[:, 0] + values[:, 1] - 2*best)/h**2
+    Hyy = (values[:, 2] + values[:, 3] - 2*best)/h**2
+    Hxy = (values[:, 4] - values[:, 5] - values[:, 6] + values[:, 7])/(4*h**2)
+    det = Hxx*Hyy - Hxy**2
+    concave = (Hxx < 0) & (det > 0)
+    det = np.where(concave, det, 1)
+    d = np.stack([-(Hyy*gx - Hxy*gy)/det, -(Hxx*gy - Hxy*gx)/det], axis=-1)
+    return np.where(concave[:, None], d, np.nan)
+
+def _search_chunk(S, damage, planar, grid, moves, step0, n_starts, n_refine):
+    """
+    Searches the critical plane of the stress states S, starting from the best `n_starts` grid normals
+    of each state, and returns the best normal and damage per state.
+    """
+    N, n_grid = S.shape[0], grid.shape[0]
+    best_normal = np.empty((N, n_starts, 3))
+    best = np.empty((N, n_starts))
+    values = _plane_damage(S, np.broadcast_to(grid, (N, n_grid, 3)), damage)
+    for i in range(n_starts):
+        idx = np.argmax(values, axis=1)
+        best[:, i] = values[np.arange(N), idx]
+        best_normal[:, i] = grid[idx]
+        # the next start must lie at least 30 degrees from this one (n and -n are the same plane)
+        values = np.where(np.abs(grid @ grid[idx].T).T > math.cos(math.pi/6), -np.inf, values)
+    state = np.repeat(np.arange(N), n_starts)
+    best_normal = best_normal.reshape(-1, 3)
+    best = best.ravel()
+
+    step = np.full(best.size, step0)
+    active = np.flatnonzero(np.isfinite(best))
+    for _ in range(n_refine):
+        if active.size == 0:
+            break
+        n = best_normal[active]
+        h = step[active]
+        basis = _tangent_basis(n, planar)
+        offset = sum(moves[None, :, i, None]*t[:, None, :] for i, t in enumerate(basis))
+        candidates = n[:, None, :] + h[:, None, None]*offset
+        candidates /= np.linalg.norm(candidates, axis=-1, keepdims=True)
+        values = _plane_damage(S[state[active]], candidates, damage)
+
+        d = _newton_step(values, best[active], h)
+        # keep Newton steps within the coarse grid spacing and skip them where the model is not concave
+        d *= np.minimum(1, step0/np.maximum(np.linalg.norm(d, axis=1), 1e-300))[:, None]
+        newton = n + sum(np.nan_to_num(d[:, i, None])*t for i, t in enumerate(basis))
+        newton /= np.linalg.norm(newton, axis=-1, keepdims=True)
+        newton_value = _plane_damage(S[state[active]], newton[:, None, :], damage)[:, 0]
+        newton_value = np.where(np.isnan(d[:, 0]), -np.inf, newton_value)
+
+        idx = np.argmax(values, axis=1)
+        value = values[np.arange(active.size), idx]
+        candidate = candidates[np.arange(active.size), idx]
+        use_newton = newton_value > value
+        value = np.where(use_newton, newton_value, value)
+        candidate = np.where(use_newton[:, None], newton, candidate)
+
+        improved = value > best[active]
+        moved = active[improved]
+        best[moved] = value[improved]
+        best_normal[moved] = candidate[improved]
+        # after a Newton move, shrink the stencil towards the step length for accurate differences
+        newton_moved = improved & use_newton
+        newton_length = np.linalg.norm(d[newton_moved], axis=1)
+        step[active[newton_moved]] = np.maximum(np.minimum(h[newton_moved], newton_length), 1e-6)
+        step[active[~improved]] /= 2
+        active = active[step[active] > 1e-10]
+
+    best = best.reshape(N, n_starts)
+    idx = np.argmax(best, axis=1)
+    return best_normal.reshape(N, n_starts, 3)[np.arange(N), idx], best[np.arange(N), idx]
+
+def _search(S, damage, planar, n_grid, n_starts, n_refine, chunk_size):
+    """
+    Coarse grid over the normal-vector hemisphere (or the x-y half circle when `planar`)
+    followed by batched local refinement in the tangent plane of each best normal.
+    Each step evaluates a compass stencil and the Newton step fitted to it, and moves to the best
+    candidate. Points that stop improving halve their stencil and drop out once it is negligible.
+    Both passes run on `chunk_size` stress states at a time, which bounds the working memory.
+    """
+    if planar:
+        theta = np.arange(n_grid)*math.pi/n_grid
+        grid = np.stack([np.cos(theta), np.sin(theta), np.zeros(n_grid)], axis=-1)
+        step0 = math.pi/n_grid
+        moves = np.array([[1], [-1]], dtype=float)
+    else:
+        # Fibonacci lattice on the upper hemisphere; n and -n describe the same plane
+        j = np.arange(n_grid) + 0.5
+        z = 1 - j/n_grid
+        azimuth = math.pi*(1 + 5**0.5)*j
+        grid = np.stack([np.sqrt(1 - z**2)*np.cos(azimuth), np.sqrt(1 - z**2)*np.sin(azimuth), z], axis=-1)
+        step0 = math.sqrt(2*math.pi/n_grid)
+        moves = np.array([[1, 0], [-1, 0], [0, 1], [0, -1], [1, 1], [1, -1], [-1, 1], [-1, -1]], dtype=float)
+
+    # refine from several well-separated grid normals of each state, since near-equal principal
+    # stresses give separate local maxima of almost the same height
+    N = S.shape[0]
+    n_starts = min(n_starts, n_grid)
+    normal = np.empty((N, 3))
+    best = np.empty(N)
+    for start in range(0, N, chunk_size):
+        rows = slice(start, min(start + chunk_size, N))
+        normal[rows], best[rows] = _search_chunk(S[rows], damage, planar, grid, moves, step0, n_starts, n_refine)
+    return normal, best
+
+def critical_plane(sigma_x, sigma_y, tau_xy, sigma_z=None, tau_yz=None, tau_zx=None, criterion='findley', k=0.3,
+                   in_plane=False, n_grid=400, n_starts=4, n_refine=100, chunk_size=4096):
+    """
+    Finds, for each stress state, the plane that maximizes a critical-plane damage parameter.
+
+    All plane orientations are searched and missing stress components are taken as zero, so giving
+    only sigma_x, sigma_y and tau_xy treats the state as plane stress. With `in_plane=True` the search
+    is restricted to planes perpendicular to the x-y plane, as in `stress_transformation.shear_stress_transform`.
+    That ignores out-of-plane planes and can be non-conservative when the principal stresses share a sign.
+
+    The Findley criterion, tau + k*sigma_n, is solved in closed form: its maximum lies on the
+    outer Mohr's circle at 2*alpha = atan2(1, k) from the major principal direction. A callable
+    criterion is searched on a coarse grid of normals followed by batched local refinement.
+
+    Parameters:
+        sigma_x (float or array_like): Normal stress in the x direction
+        sigma_y (float or array_like): Normal stress in the y direction
+        tau_xy (float or array_like): Shear stress in the x-y plane
+        sigma_z (float or array_like): Normal stress in the z direction
+        tau_yz (float or array_like): Shear stress in the y-z plane
+        tau_zx (float or array_like): Shear stress in the z-x plane
+        criterion (str or callable): 'findley', or damage(sigma_n, tau) taking and returning arrays
+        k (float): Findley normal stress sensitivity constant
+        in_plane (bool): Only search planes perpendicular to the x-y plane (2D input only)
+        n_grid (int): Number of normals in the coarse grid (callable criterion only)
+        n_starts (int): Number of grid normals, at least 30 degrees apart, refined per stress state
+            (callable criterion only)
+        n_refine (int): Maximum number of refinement iterations (callable criterion only)
+        chunk_size (int): Number of stress states searched together, which bounds the memory of the
+            grid evaluation and refinement (callable criterion only)
+
+    Returns:
+        tuple: (normal, damage) where normal has shape (..., 3) and damage has the broadcast shape of the inputs
+
+    Raises:
+        ValueError: If `criterion` is not 'findley' or a callable, or if `in_plane` is used with
+            sigma_z, tau_yz or tau_zx
+    """
+    planar = bool(in_plane)
+    if planar and not (sigma_z is None and tau_yz is None and tau_zx is None):
+        raise ValueError("in_plane=True only applies to 2D input (sigma_x, sigma_y and tau_xy)")
+    S, shape = _stress_tensor(sigma_x, sigma_y, tau_xy,
+                              0 if sigma_z is None else sigma_z,
+                              0 if tau_yz is None else tau_yz,
+                              0 if tau_zx is None else tau_zx)
+
+    if callable(criterion):
+        normal, damage = _search(S, criterion, planar, n_grid, n_starts, n_refine, chunk_size)
+        return normal.reshape(shape + (3,)), damage.reshape(shape)
+    if criterion != 'findley':
+        raise ValueError("criterion must be 'findley' or a callable damage(sigma_n, tau)")
+
+    alpha = math.atan2(1, k)/2
+    if planar:
+        center = (S[:, 0, 0] + S[:, 1, 1])/2
+        radius = np.sqrt(((S[:, 0, 0] - S[:, 1, 1])/2)**2 + S[:, 0, 1]**2)
+        theta_p = np.arctan2(2*S[:, 0, 1], S[:, 0, 0] - S[:, 1, 1])/2
+        theta = theta_p + alpha
+        normal = np.stack([np.cos(theta), np.sin(theta), np.zeros(theta.shape)], axis=-1)
+    else:
+        principal, directions = np.linalg.eigh(S)
+        center = (principal[:, 2] + principal[:, 0])/2
+        radius = (principal[:, 2] - principal[:, 0])/2
+        normal = math.cos(alpha)*directions[:, :, 2] + math.sin(alpha)*directions[:, :, 0]
+    damage = k*center + radius*math.sqrt(1 + k**2)
+    return normal.reshape(shape + (3,)), damage.reshape(shape)
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 import matplotlib.pyplot as plt
 
 def average_strain(epsilon_x, epsilon_y):
@@ -75,8 +76,8 @@ def principal_strain(epsilon_x, epsilon_y, gamma_xy):
     epsilon_double_prime = (epsilon_x - epsilon_y)/2
     gamma_prime = gamma_xy/2
 
-    epsilon_1 = epsilon_prime + math.sqrt(epsilon_double_prime**2 + gamma_prime**2)
-    epsilon_2 = epsilon_prime - math.sqrt(epsilon_double_prime**2 + gamma_prime**2)
+    epsilon_1 = epsilon_prime + np.sqrt(epsilon_double_prime**2 + gamma_prime**2)
+    epsilon_2 = epsilon_prime - np.sqrt(epsilon_double_prime**2 + gamma_prime**2)
 
     return epsilon_1, epsilon_2
 
@@ -95,7 +96,7 @@ def principal_strain_angle(epsilon_x, epsilon_y, gamma_xy):
     epsilon_double_prime = (epsilon_x - epsilon_y)/2
     gamma_prime = gamma_xy/2
 
-    theta_1 = math.degrees(math.atan2(gamma_prime, epsilon_double_prime))/2
+    theta_1 = np.degrees(np.arctan2(gamma_prime, epsilon_double_prime))/2
     theta_2 = theta_1 + 90
 
     return theta_1, theta_2
@@ -115,7 +116,7 @@ def maximum_in_plane_shear_strain(epsilon_x, epsilon_y, gamma_xy):
     epsilon_double_prime = (epsilon_x - epsilon_y)/2
     gamma_prime = gamma_xy/2
 
-    gamma_max = 2*math.sqrt(epsilon_double_prime**2 + gamma_prime**2)
+    gamma_max = 2*np.sqrt(epsilon_double_prime**2 + gamma_prime**2)
 
     return gamma_max
 
@@ -155,7 +156,7 @@ def mohrs_circle(epsilon_x, epsilon_y, gamma_xy):
     gamma_prime = gamma_xy/2
 
     center = (epsilon_prime, 0)
-    radius = math.sqrt(epsilon_double_prime**2 + gamma_prime**2)
+    radius = np.sqrt(epsilon_double_prime**2 + gamma_prime**2)
 
     return center, radius
 
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 import matplotlib.pyplot as plt
 
 def average_normal_stress(sigma_x, sigma_y):
@@ -63,8 +64,8 @@ def principal_stress(sigma_x, sigma_y, tau_xy):
     Returns:
         tuple: Major and minor principal stresses.
     """
-    sigma_1 = (sigma_x + sigma_y)/2 + math.sqrt(((sigma_x - sigma_y)/2)**2 + tau_xy**2)
-    sigma_2 = (sigma_x + sigma_y)/2 - math.sqrt(((sigma_x - sigma_y)/2)**2 + tau_xy**2)
+    sigma_1 = (sigma_x + sigma_y)/2 + np.sqrt(((sigma_x - sigma_y)/2)**2 + tau_xy**2)
+    sigma_2 = (sigma_x + sigma_y)/2 - np.sqrt(((sigma_x - sigma_y)/2)**2 + tau_xy**2)
     return sigma_1, sigma_2
 
 def principal_stress_angle(sigma_x, sigma_y, tau_xy):
@@ -81,8 +82,8 @@ def principal_stress_angle(sigma_x, sigma_y, tau_xy):
     """
     numerator = 2 * tau_xy
     denominator = sigma_x - sigma_y
-    theta_p_rad = math.atan2(numerator, denominator) / 2  # atan2 takes care of the angle quadrant
-    theta_p_deg = math.degrees(theta_p_rad)  # converting radians to degrees
+    theta_p_rad = np.arctan2(numerator, denominator) / 2  # atan2 takes care of the angle quadrant
+    theta_p_deg = np.degrees(theta_p_rad)  # converting radians to degrees
     
     return theta_p_deg, theta_p_deg + 90
 
@@ -98,7 +99,7 @@ def maximum_in_plane_shear_stress(sigma_x, sigma_y, tau_xy):
     Returns:
         float: Maximum in-plane shear stress.
     """
-    tau_max = math.sqrt(((sigma_x - sigma_y)/2)**2 + tau_xy**2)
+    tau_max = np.sqrt(((sigma_x - sigma_y)/2)**2 + tau_xy**2)
     return tau_max
 
 def maximum_in_plane_shear_stress_angle(sigma_x, sigma_y, tau_xy):
@@ -133,7 +134,7 @@ def mohrs_circle(sigma_x, sigma_y, tau_xy):
         tuple: (center, radius) of the Mohr's circle.
     """
     center = (sigma_x + sigma_y)/2
-    radius = math.sqrt(((sigma_x - sigma_y)/2)**2 + tau_xy**2)
+    radius = np.sqrt(((sigma_x - sigma_y)/2)**2 + tau_xy**2)
     return (center, radius)
 
 def mohrs_circle_plot(sigma_x, sigma_y, tau_xy):
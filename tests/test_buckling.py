@@ -0,0 +1,73 @@
+import math
+import numpy as np
+import pytest
+from mods.buckling import (critical_stress, critical_stress_tangent_modulus, effective_length_factor,
+                           ramberg_osgood_tangent_modulus, tabulated_tangent_modulus)
+
+E, SIGMA_Y, N = 200e3, 250., 15
+STRAIN = [0, 0.00125, 0.004, 0.02]
+STRESS = [0, 250, 280, 300]
+
+def test_effective_length_factor():
+    K = effective_length_factor([['pin', 'fixed'], ['pin-fixed', 'fixed-free']])
+    np.testing.assert_array_equal(K, [[1, 0.5], [0.7, 2]])
+
+def test_effective_length_factor_unknown_support():
+    with pytest.raises(ValueError, match="foo"):
+        effective_length_factor(['pin', 'foo'])
+
+def test_ramberg_osgood_tangent_modulus():
+    assert ramberg_osgood_tangent_modulus(0., E, SIGMA_Y, N) == pytest.approx(E)
+    expected = 1/(1/E + 0.002*N/SIGMA_Y)
+    assert ramberg_osgood_tangent_modulus(SIGMA_Y, E, SIGMA_Y, N) == pytest.approx(expected)
+
+def test_tabulated_tangent_modulus():
+    E_t = tabulated_tangent_modulus([100., 260., 290., 310.], STRAIN, STRESS)
+    np.testing.assert_allclose(E_t, [200e3, 30/0.00275, 20/0.016, 0])
+
+def test_ramberg_osgood_residual_below_tol():
+    L = np.linspace(500, 10000, 1000)
+    support = np.array(['pin', 'fixed', 'pin-fixed', 'fixed-free'])[np.arange(L.size) % 4]
+    tol = 1e-10
+    sigma_cr = critical_stress_tangent_modulus(L, 50., support, E=E, sigma_y=SIGMA_Y, n=N, tol=tol)
+    E_t = ramberg_osgood_tangent_modulus(sigma_cr, E, SIGMA_Y, N)
+    residual = sigma_cr - math.pi**2*E_t/(effective_length_factor(support)*L/50.)**2
+    assert np.all(np.abs(residual) <= tol*sigma_cr)
+
+def test_tabulated_root_at_breakpoint():
+    assert critical_stress_tangent_modulus(1000., 20., 'pin', strain=STRAIN, stress=STRESS) == pytest.approx(250)
+
+def test_elastic_limit_matches_critical_stress():
+    sigma_cr = critical_stress_tangent_modulus(5000., 20., 'pin', strain=STRAIN, stress=STRESS)
+    assert sigma_cr == pytest.approx(critical_stress(E, 5000., 20., 'pin'))
+
+def test_unconverged_columns_are_nan():
+    with pytest.warns(RuntimeWarning):
+        sigma_cr = critical_stress_tangent_modulus([1500., 3000.], 50., 'pin', E=E, sigma_y=SIGMA_Y, n=N, max_iter=2)
+    assert np.all(np.isnan(sigma_cr))
+
+@pytest.mark.parametrize("L, r", [(0., 20.), (1000., 0.)])
+def test_non_positive_geometry(L, r):
+    with pytest.raises(ValueError):
+        critical_stress_tangent_modulus(L, r, 'pin', E=E, sigma_y=SIGMA_Y, n=N)
+
+def test_both_curves_rejected():
+    with pytest.raises(ValueError):
+        critical_stress_tangent_modulus(1000., 20., 'pin', E=E, sigma_y=SIGMA_Y, n=N, strain=STRAIN, stress=STRESS)
+
+def test_E_must_match_tabulated_curve():
+    with pytest.raises(ValueError):
+        critical_stress_tangent_modulus(1000., 20., 'pin', E=100e3, strain=STRAIN, stress=STRESS)
+
+@pytest.mark.parametrize("strain, stress", [
+    ([0, 0.00125, 0.004, 0.02], [0, 250, 240, 300]),
+    ([0, 0.00125, 0.00125, 0.02], [0, 250, 280, 300]),
+    ([0.001, 0.00125, 0.004, 0.02], [0, 250, 280, 300]),
+    ([0, 0.00125, 0.004], [0, 250, 280, 300]),
+    ([0], [0]),
+])
+def test_malformed_tabulated_curve(strain, stress):
+    with pytest.raises(ValueError):
+        tabulated_tangent_modulus(100., strain, stress)
+    with pytest.raises(ValueError):
+        critical_stress_tangent_modulus(1000., 20., 'pin', strain=strain, stress=stress)
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+from mods import cli
+from mods.cli import main
+
+# sigma_x, sigma_y, tau_xy -> sigma_1, sigma_2, theta_p, von Mises and Tresca utilization for S_y = 250 MPa
+STATES = [[100., 0., 0.], [50., -50., 0.], [80., 20., 40.]]
+EXPECTED = {
+    'sigma_1': [100., 50., 100.],
+    'sigma_2': [0., -50., 0.],
+    'theta_p': [0., 0., 26.565051177077994],
+    'von_mises_utilization': [0.4, np.sqrt(3)*50/250, 0.4],
+    'tresca_utilization': [0.4, 0.4, 0.4],
+}
+
+def write_csv(path, states=STATES, columns=('sigma_x', 'sigma_y', 'tau_xy')):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(states, columns=list(columns)).to_csv(path, index=False)
+    return path
+
+def test_csv_principal_and_utilization(tmp_path):
+    write_csv(tmp_path / 'states.csv')
+    assert main([str(tmp_path / 'states.csv'), '-q', 'principal,utilization', '-m', 'Structural A-36', '-j', '1']) == 0
+    result = pd.read_csv(tmp_path / 'states_mods.csv')
+    assert list(result.columns) == list(EXPECTED)
+    for name, expected in EXPECTED.items():
+        np.testing.assert_allclose(result[name], expected, atol=1e-12)
+
+def test_npy_principal_and_utilization(tmp_path):
+    np.save(tmp_path / 'states.npy', np.array(STATES))
+    assert main([str(tmp_path / 'states.npy'), '-q', 'principal,utilization', '-m', 'Structural A-36']) == 0
+    result = np.load(tmp_path / 'states_mods.npy')
+    for name, expected in EXPECTED.items():
+        np.testing.assert_allclose(result[name], expected, atol=1e-12)
+
+def test_csv_split_across_workers(tmp_path, monkeypatch):
+    states = np.random.default_rng(0).normal(size=(2000, 3))*100
+    write_csv(tmp_path / 'big.csv', states)
+    assert main([str(tmp_path / 'big.csv'), '-o', str(tmp_path / 'serial'), '-j', '1']) == 0
+    monkeypatch.setattr(cli, '_MIN_CSV_PART_BYTES', 1024)
+    assert main([str(tmp_path / 'big.csv'), '-o', str(tmp_path / 'parallel'), '-j', '3', '--chunk-size', '100']) == 0
+    assert (tmp_path / 'parallel' / 'big_mods.csv').read_text() == (tmp_path / 'serial' / 'big_mods.csv').read_text()
+    assert list((tmp_path / 'parallel').iterdir()) == [tmp_path / 'parallel' / 'big_mods.csv']
+
+@pytest.mark.parametrize("args", [
+    ['-q', 'utilization', '-m', 'Gray ASTM 20'],
+    ['-q', 'utilization', '-m', 'Unobtainium'],
+    ['-q', 'utilization'],
+    ['--columns', 'sx,sy,txy'],
+])
+def test_error_exits(tmp_path, args):
+    write_csv(tmp_path / 'states.csv')
+    assert main([str(tmp_path / 'states.csv')] + args) == 1
+
+def test_glob_inputs_with_same_name_keep_directories(tmp_path):
+    write_csv(tmp_path / 'a' / 'run.csv')
+    write_csv(tmp_path / 'b' / 'run.csv', STATES[:2])
+    assert main([str(tmp_path / '*' / 'run.csv'), '-o', str(tmp_path / 'out'), '-j', '2']) == 0
+    assert len(pd.read_csv(tmp_path / 'out' / 'a' / 'run_mods.csv')) == 3
+    assert len(pd.read_csv(tmp_path / 'out' / 'b' / 'run_mods.csv')) == 2
+
+def test_glob_skips_previous_outputs(tmp_path):
+    write_csv(tmp_path / 'run.csv')
+    assert main([str(tmp_path / '*.csv')]) == 0
+    assert main([str(tmp_path / '*.csv')]) == 0
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['run.csv', 'run_mods.csv']
+
+def test_refuses_to_overwrite_input(tmp_path):
+    write_csv(tmp_path / 'run.csv')
+    write_csv(tmp_path / 'run_mods.csv')
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(tmp_path / 'run.csv'), str(tmp_path / 'run_mods.csv')])
+    assert excinfo.value.code == 2
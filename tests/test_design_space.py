@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from mods import datasets
+from mods.buckling import critical_load
+from mods.design_space import critical_load_grid
+
+LENGTHS = [1000., 2500., 4000.]
+
+@pytest.fixture(scope='module')
+def grid():
+    return critical_load_grid(LENGTHS)
+
+@pytest.mark.parametrize("units, shapes, props, I_col, E_col", [
+    ('si', datasets.get_w_shapes_si, datasets.get_mechanical_properties_si, 'Iyy (mm4)', 'Moduls of Elasticity (MPa)'),
+    ('imperial', datasets.get_w_shapes_imperial, datasets.get_mechanical_properties_imperial, 'Iyy (in4)',
+     'Moduls of Elasticity (ksi)'),
+])
+def test_values_match_critical_load(units, shapes, props, I_col, E_col):
+    g = critical_load_grid(LENGTHS, units=units)
+    shapes, props = shapes(), props()
+    values = g.values
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        i, j, l, m = (rng.integers(n) for n in g.shape)
+        expected = critical_load(props[E_col][m], shapes[I_col][i], LENGTHS[l], g.coords['support'][j])
+        assert values[i, j, l, m] == pytest.approx(expected)
+
+def test_sel_shapes_match_values(grid):
+    section = grid.coords['section'][3]
+    scalar = grid.sel(section=section, support='pin', material='Structural A-36')
+    assert scalar.shape == (len(LENGTHS),)
+    listed = grid.sel(support=['fixed', 'pin'], length=LENGTHS[1])
+    assert listed.shape == (grid.shape[0], 2, grid.shape[3])
+
+    values = grid.values
+    m = grid.coords['material'].index('Structural A-36')
+    np.testing.assert_array_equal(scalar, values[3, 0, :, m])
+    np.testing.assert_array_equal(listed, values[:, [1, 0], 1, :])
+    np.testing.assert_array_equal(grid.sel(support=['fixed', 'pin'], length=LENGTHS[1]), listed)
+
+def test_to_frame_matches_values(grid):
+    frame = grid.to_frame()
+    np.testing.assert_array_equal(frame['critical_load'].to_numpy(), grid.values.ravel())
+    first = frame.iloc[1]
+    assert (first['section'], first['support'], first['length'], first['material']) == (
+        grid.coords['section'][0], grid.coords['support'][0], LENGTHS[0], grid.coords['material'][1])
+
+@pytest.mark.parametrize("labels", [
+    {'section': 'W1 X 1'}, {'support': 'hinge'}, {'material': 'Unobtainium'}, {'length': 1234.}, {'axis': 'x'},
+])
+def test_sel_unknown_labels(grid, labels):
+    with pytest.raises(ValueError):
+        grid.sel(**labels)
+
+@pytest.mark.parametrize("kwargs", [
+    {'sections': ['W1 X 1']}, {'supports': ['hinge']}, {'materials': ['Unobtainium']},
+])
+def test_grid_unknown_inputs(kwargs):
+    with pytest.raises(ValueError):
+        critical_load_grid(LENGTHS, **kwargs)
+
+def test_single_string_inputs(grid):
+    section = grid.coords['section'][3]
+    single = critical_load_grid(LENGTHS, sections=section, supports='pin', materials='Structural A-36')
+    assert single.shape == (1, 1, len(LENGTHS), 1)
+    assert single.coords['section'] == [section]
+    np.testing.assert_array_equal(single.values[0, 0, :, 0], grid.sel(section=section, support='pin',
+                                                                      material='Structural A-36'))
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from mods.fatigue import critical_plane, findley_parameter
+
+K = 0.3
+
+def findley(sigma_n, tau):
+    return findley_parameter(sigma_n, tau, K)
+
+def plane_damage(normal, sigma_x, sigma_y, tau_xy, sigma_z=0, tau_yz=0, tau_zx=0):
+    sx, sy, sz, txy, tyz, tzx = np.broadcast_arrays(sigma_x, sigma_y, sigma_z, tau_xy, tau_yz, tau_zx)
+    S = np.stack([np.stack([sx, txy, tzx], -1), np.stack([txy, sy, tyz], -1), np.stack([tzx, tyz, sz], -1)], -2)
+    traction = np.einsum('...ab,...b->...a', S, normal)
+    sigma_n = np.einsum('...a,...a->...', traction, normal)
+    tau = np.sqrt(np.einsum('...a,...a->...', traction, traction) - sigma_n**2)
+    return findley(sigma_n, tau)
+
+@pytest.fixture(scope='module')
+def states():
+    return np.random.default_rng(0).normal(size=(6, 500))*100
+
+@pytest.mark.parametrize("n_components, in_plane", [(3, True), (3, False), (6, False)])
+def test_closed_form_matches_search(states, n_components, in_plane):
+    components = states[:n_components]
+    _, closed = critical_plane(*components, k=K, in_plane=in_plane)
+    _, searched = critical_plane(*components, criterion=findley, in_plane=in_plane)
+    np.testing.assert_allclose(searched, closed, rtol=0, atol=1e-8)
+
+@pytest.mark.parametrize("n_components, in_plane", [(3, True), (3, False), (6, False)])
+def test_normal_reproduces_damage(states, n_components, in_plane):
+    components = states[:n_components]
+    for criterion in ('findley', findley):
+        normal, damage = critical_plane(*components, criterion=criterion, k=K, in_plane=in_plane)
+        np.testing.assert_allclose(np.linalg.norm(normal, axis=-1), 1)
+        np.testing.assert_allclose(plane_damage(normal, *components), damage, rtol=0, atol=1e-8)
+
+def test_plane_stress_includes_out_of_plane_planes():
+    _, damage = critical_plane(100., 100., 0., k=K)
+    _, damage_3d = critical_plane(100., 100., 0., sigma_z=0., k=K)
+    _, damage_in_plane = critical_plane(100., 100., 0., k=K, in_plane=True)
+    assert damage == pytest.approx(damage_3d)
+    assert damage == pytest.approx(K*50 + 50*np.sqrt(1 + K**2))
+    assert damage_in_plane == pytest.approx(K*100)
+
+def test_unknown_criterion():
+    with pytest.raises(ValueError):
+        critical_plane(1., 2., 3., criterion='dang-van')
+
+def test_in_plane_rejects_3d_input():
+    with pytest.raises(ValueError):
+        critical_plane(1., 2., 3., sigma_z=1., in_plane=True)
+
+def test_chunked_search_matches_single_chunk(states):
+    normal, damage = critical_plane(*states, criterion=findley)
+    chunked_normal, chunked_damage = critical_plane(*states, criterion=findley, chunk_size=7)
+    np.testing.assert_allclose(chunked_damage, damage, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(chunked_normal, normal, rtol=0, atol=1e-12)